@@ -4,9 +4,9 @@ Load configuration from environment and YAML files.
 """
 
 import os
+import pickle
 from pathlib import Path
 
-import yaml
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,6 +28,10 @@ DATABASE_PATH = DATA_DIR / "prices.db"
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 
+# HTTP connection pool for the Telegram client
+TELEGRAM_POOL_SIZE = int(os.getenv("TELEGRAM_POOL_SIZE", "16"))
+TELEGRAM_POOL_TIMEOUT = float(os.getenv("TELEGRAM_POOL_TIMEOUT", "3.0"))
+
 # Scraping defaults
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 TIMEOUT_MS = int(os.getenv("TIMEOUT_MS", "30000"))
@@ -45,12 +49,99 @@ SCRAPE_INTERVAL_HOURS = int(os.getenv("SCRAPE_INTERVAL_HOURS", "4"))
 # Alert threshold
 PRICE_CHANGE_THRESHOLD_PERCENT = float(os.getenv("PRICE_CHANGE_THRESHOLD_PERCENT", "0"))
 
+# Suppress identical alerts re-sent within this window (0 disables)
+ALERT_DEDUP_TTL_SECONDS = float(os.getenv("ALERT_DEDUP_TTL_SECONDS", "300"))
+
+
+# Parsed-config cache, invalidated when competitors.yaml is modified
+_config_cache = {"mtime": None, "data": None}
+
+# Pickled sidecar so fresh processes (cron-style --once runs) skip the YAML parse
+_PICKLE_CACHE_PATH = TMP_DIR / "competitors.pkl"
+
+
+def _load_pickle_cache(mtime: int):
+    """Return cached config from the pickle sidecar if it matches mtime."""
+    try:
+        with open(_PICKLE_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("mtime") == mtime:
+            return cached["data"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+    return None
+
+
+def _write_pickle_cache(mtime: int, data: dict):
+    """Atomically write the pickle sidecar (best-effort)."""
+    tmp_path = _PICKLE_CACHE_PATH.with_suffix(".pkl.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"mtime": mtime, "data": data}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _PICKLE_CACHE_PATH)
+    except OSError:
+        pass
+
 
 def load_competitors_config() -> dict:
-    """Load competitors configuration from YAML."""
+    """Load competitors configuration from YAML (cached on file mtime)."""
     config_path = CONFIG_DIR / "competitors.yaml"
     if not config_path.exists():
         return {"competitors": [], "alerts": {}, "scraping": {}}
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    mtime = config_path.stat().st_mtime_ns
+    if _config_cache["mtime"] == mtime:
+        return _config_cache["data"]
+
+    data = _load_pickle_cache(mtime)
+    if data is None:
+        # Deferred so processes served by the pickle sidecar (or that never
+        # touch the config) skip the yaml import entirely
+        import yaml
+        try:
+            # libyaml C bindings - ~10x faster than the pure-Python loader
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=YamlLoader) or {}
+        _write_pickle_cache(mtime, data)
+
+    _config_cache["mtime"] = mtime
+    _config_cache["data"] = data
+    # Invalidate the derived product list alongside the raw config
+    _config_cache.pop("targets", None)
+    return data
+
+
+def _flatten_products(config: dict) -> list[dict]:
+    """Flatten enabled competitors into one scrape-ready product list."""
+    targets = []
+    for competitor in config.get("competitors", []):
+        if not competitor.get("enabled", True):
+            continue
+        name = competitor["name"]
+        base_url = competitor["base_url"]
+        for product in competitor.get("products", []):
+            targets.append({
+                "competitor": name,
+                "product_id": product["id"],
+                "url": base_url + product["url"],
+                "selectors": product.get("selectors", {}),
+                "requires_js": product.get("requires_js", True)
+            })
+    return targets
+
+
+def load_product_targets() -> list[dict]:
+    """
+    Flat list of scrape targets with pre-joined URLs and normalized
+    selectors, cached together with the parsed YAML.
+    """
+    config = load_competitors_config()
+    targets = _config_cache.get("targets")
+    if targets is None:
+        targets = _flatten_products(config)
+        _config_cache["targets"] = targets
+    return targets
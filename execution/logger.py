@@ -2,9 +2,13 @@
 User-friendly logging system with colorful console output and file logging.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from colorama import Fore, Style, init
@@ -24,8 +28,12 @@ if sys.platform == 'win32':
         pass
 
 # Detect if console supports Unicode
+@functools.cache
 def supports_unicode():
     """Check if the console supports Unicode characters."""
+    # UTF streams always can; answer without probing the (colorama-wrapped) stream
+    if (getattr(sys.stdout, 'encoding', '') or '').lower().startswith('utf'):
+        return True
     try:
         # Try to encode a test emoji
         '✓'.encode(sys.stdout.encoding or 'ascii')
@@ -69,24 +77,34 @@ class ColoredFormatter(logging.Formatter):
         super().__init__()
         # Choose icon set based on console capability
         self.ICONS = self.ICONS_UNICODE if USE_UNICODE else self.ICONS_ASCII
+        # Precompute the static per-level pieces: "<color>[" ... "] [LEVEL] ICON "
+        self._level_parts = {
+            level: (color, f"] [{level}] {self.ICONS.get(level, '')} ".rstrip() + " ")
+            for level, color in self.COLORS.items()
+        }
+        # Timestamps have 1s resolution, so cache the formatted string
+        self._time_sec = None
+        self._time_str = ""
 
     def format(self, record):
         """Format log record with colors and icons."""
-        # Add color to level name
         levelname = record.levelname
-        color = self.COLORS.get(levelname, '')
-        icon = self.ICONS.get(levelname, '')
+        color, level_part = self._level_parts.get(levelname, ('', f"] [{levelname}] "))
 
         # Format: [TIME] [LEVEL] [ICON] Message
-        log_time = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+        created = int(record.created)
+        if created != self._time_sec:
+            self._time_sec = created
+            self._time_str = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S')
+
         message = record.getMessage()
 
         # Format with color and icon for console
         try:
-            return f"{color}[{log_time}] [{levelname}] {icon} {message}{Style.RESET_ALL}"
+            return f"{color}[{self._time_str}{level_part}{message}{Style.RESET_ALL}"
         except UnicodeEncodeError:
             # Fallback to ASCII if encoding fails
-            return f"{color}[{log_time}] [{levelname}] {message}{Style.RESET_ALL}"
+            return f"{color}[{self._time_str}] [{levelname}] {message}{Style.RESET_ALL}"
 
 
 class SimpleFormatter(logging.Formatter):
@@ -96,10 +114,27 @@ class SimpleFormatter(logging.Formatter):
         return record.getMessage()
 
 
+# Background listeners that drain log queues; stopped at interpreter exit
+_listeners = []
+
+
+def _stop_listeners():
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
 def setup_logger(name: str = "price_monitor", log_level: str = "INFO") -> logging.Logger:
     """
     Set up a user-friendly logger with both console and file output.
 
+    File records are routed through a QueueHandler/QueueListener pair, so
+    file I/O happens on a background thread instead of the logging call
+    path. Records hit the file as they arrive, keeping logs/ current for
+    operators even between infrequent cycles.
+
     Args:
         name: Logger name
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -110,8 +145,9 @@ def setup_logger(name: str = "price_monitor", log_level: str = "INFO") -> loggin
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Already configured - reuse instead of stacking duplicate handlers
+    if logger.handlers:
+        return logger
 
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
@@ -132,7 +168,13 @@ def setup_logger(name: str = "price_monitor", log_level: str = "INFO") -> loggin
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    _listeners.append(listener)
 
     return logger
 
@@ -10,10 +10,6 @@ import argparse
 import sys
 import time
 from datetime import datetime
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import (
     SCRAPE_INTERVAL_HOURS,
@@ -21,7 +17,12 @@ from config.settings import (
     load_competitors_config
 )
 from execution.scraper import PriceScraper
-from execution.storage import init_database, save_price, detect_price_change
+from execution.storage import (
+    init_database,
+    get_latest_prices,
+    save_prices_bulk,
+    evaluate_price_change
+)
 from execution.telegram import TelegramBot
 from execution.logger import setup_logger
 
@@ -41,7 +42,6 @@ def run_scrape_cycle() -> dict:
     # Initialize
     init_database()
     scraper = PriceScraper()
-    bot = TelegramBot()
     config = load_competitors_config()
 
     threshold = config.get("alerts", {}).get(
@@ -55,20 +55,23 @@ def run_scrape_cycle() -> dict:
 
     # Process results
     changes = []
-    success_count = 0
-    error_count = 0
+    new_rows = []
 
-    for result in results:
-        if not result["success"]:
-            error_count += 1
-            continue
+    successful = [r for r in results if r["success"]]
+    success_count = len(successful)
+    error_count = len(results) - success_count
 
-        success_count += 1
+    # One bulk query for all previous prices instead of one SELECT per product
+    latest_prices = get_latest_prices(
+        [(r["product_id"], r["competitor"]) for r in successful]
+    )
 
-        # Check for price change
-        change = detect_price_change(
+    for result in successful:
+        # Check for price change against the prefetched snapshot
+        change = evaluate_price_change(
             product_id=result["product_id"],
             competitor_name=result["competitor"],
+            old_price=latest_prices.get((result["product_id"], result["competitor"])),
             new_price=result["price"],
             threshold_percent=threshold
         )
@@ -76,27 +79,32 @@ def run_scrape_cycle() -> dict:
         if change:
             changes.append(change)
 
-        # Save to database (always, regardless of change)
-        save_price(
-            competitor_name=result["competitor"],
-            product_id=result["product_id"],
-            price=result["price"],
-            product_name=result.get("name"),
-            stock_status=result.get("stock_status"),
-            url=result["url"]
-        )
+        # Queue for the bulk save (always, regardless of change)
+        new_rows.append((
+            result["competitor"],
+            result["product_id"],
+            result.get("name"),
+            result["price"],
+            "USD",
+            result.get("stock_status"),
+            result["url"]
+        ))
+
+    # One transaction for the whole cycle instead of one commit per row
+    save_prices_bulk(new_rows)
 
     # Send alerts
     alerts_sent = 0
     if changes:
         try:
-            if batch_alerts:
-                bot.send_batch_alerts(changes)
-                alerts_sent = 1
-            else:
-                for change in changes:
-                    bot.send_price_alert(change)
-                    alerts_sent += 1
+            with TelegramBot() as bot:
+                if batch_alerts:
+                    bot.send_batch_alerts(changes)
+                    alerts_sent = 1
+                else:
+                    for change in changes:
+                        bot.send_price_alert(change)
+                        alerts_sent += 1
             logger.info(f"Sent {alerts_sent} alert(s) for {len(changes)} price change(s)")
         except Exception as e:
             logger.error(f"Failed to send alerts: {e}")
@@ -129,15 +137,29 @@ def run_daemon(interval_hours: float = None):
     logger.info(f"Starting daemon mode (interval: {interval} hours)")
     logger.info("Press Ctrl+C to stop")
 
+    # Absolute deadlines so cycle runtime doesn't accumulate as drift
+    next_deadline = time.monotonic()
+
     try:
         while True:
             run_scrape_cycle()
 
-            next_run = datetime.now().timestamp() + interval_seconds
+            next_deadline += interval_seconds
+            sleep_for = next_deadline - time.monotonic()
+
+            if sleep_for <= 0:
+                logger.warning(
+                    f"Scrape cycle overran the {interval}h interval by "
+                    f"{-sleep_for:.0f}s; starting next cycle immediately"
+                )
+                next_deadline = time.monotonic()
+                continue
+
+            next_run = datetime.now().timestamp() + sleep_for
             next_run_str = datetime.fromtimestamp(next_run).strftime("%Y-%m-%d %H:%M:%S")
             logger.info(f"Next run at: {next_run_str}")
 
-            time.sleep(interval_seconds)
+            time.sleep(sleep_for)
 
     except KeyboardInterrupt:
         logger.info("Daemon stopped by user")
@@ -9,14 +9,36 @@ Output:
 """
 
 import argparse
+import atexit
+import os
 import sys
 from datetime import datetime
-
-import httpx
-from bs4 import BeautifulSoup
+from pathlib import Path
 
 from utils import save_json
 
+USER_AGENT = os.getenv("USER_AGENT", "")
+
+# One shared client so repeated calls reuse pooled connections (and HTTP/2
+# multiplexing) instead of paying a TCP+TLS handshake per request. Built
+# lazily so importing this module doesn't drag in the httpx stack.
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=30,
+            headers={"User-Agent": USER_AGENT} if USER_AGENT else None
+        )
+        atexit.register(_client.close)
+    return _client
+
 
 def scrape_url(url: str, selectors: list[str] | None = None) -> dict:
     """
@@ -29,14 +51,20 @@ def scrape_url(url: str, selectors: list[str] | None = None) -> dict:
     Returns:
         Dictionary with extracted data
     """
-    response = httpx.get(url, timeout=30, follow_redirects=True)
+    from bs4 import BeautifulSoup
+
+    response = _get_client().get(url)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # lxml (libxml2 C bindings) parses the same bytes 5-20x faster than
+    # the pure-Python html.parser
+    soup = BeautifulSoup(response.text, "lxml")
 
-    # Remove script and style elements
-    for element in soup(["script", "style", "nav", "footer"]):
-        element.decompose()
+    # Remove script and style elements before full-text extraction; skip it
+    # when specific selectors are requested since they target content nodes
+    if not selectors:
+        for element in soup.select("script,style,nav,footer"):
+            element.decompose()
 
     result = {
         "url": url,
@@ -58,7 +86,14 @@ def scrape_url(url: str, selectors: list[str] | None = None) -> dict:
     return result
 
 
+def write_output(data: dict, filename: str = "scraped_data.json") -> Path:
+    """Write scraped data to .tmp as JSON (orjson-backed via save_json)."""
+    return save_json(data, filename)
+
+
 def main():
+    import httpx
+
     parser = argparse.ArgumentParser(description="Scrape a single website")
     parser.add_argument("url", help="URL to scrape")
     parser.add_argument("--selectors", help="Comma-separated CSS selectors", default=None)
@@ -69,7 +104,7 @@ def main():
 
     try:
         data = scrape_url(args.url, selectors)
-        output_path = save_json(data, "scraped_data.json")
+        output_path = write_output(data)
         print(f"Success: Data saved to {output_path}")
         return 0
     except httpx.HTTPError as e:
@@ -8,23 +8,18 @@ Usage:
 
 import argparse
 import random
-import re
 import sys
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeout
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config.settings import (
     HEADLESS,
     TIMEOUT_MS,
     USER_AGENT,
     PROXY_URL,
-    load_competitors_config
+    load_competitors_config,
+    load_product_targets
 )
 from execution.logger import get_logger
 
@@ -37,6 +32,16 @@ def random_delay(min_sec: float = 2, max_sec: float = 5):
     time.sleep(delay)
 
 
+class _DropNonPrice(dict):
+    """Translation table that deletes every char except digits, '.' and ','."""
+
+    def __missing__(self, key):
+        return None
+
+
+_PRICE_KEEP = _DropNonPrice({ord(c): c for c in '0123456789.,'})
+
+
 def parse_price(text: str) -> Optional[float]:
     """
     Extract numeric price from text.
@@ -46,21 +51,30 @@ def parse_price(text: str) -> Optional[float]:
     if not text:
         return None
 
-    # Remove currency symbols and whitespace
-    cleaned = re.sub(r'[^\d.,]', '', text.strip())
+    # Drop currency symbols and whitespace in one C-level pass
+    cleaned = text.translate(_PRICE_KEEP)
+
+    # Single pass to locate the separators
+    last_dot = last_comma = -1
+    comma_count = 0
+    for i, ch in enumerate(cleaned):
+        if ch == ',':
+            last_comma = i
+            comma_count += 1
+        elif ch == '.':
+            last_dot = i
 
     # Handle European format (1.234,56) vs US format (1,234.56)
-    if ',' in cleaned and '.' in cleaned:
-        if cleaned.rindex(',') > cleaned.rindex('.'):
+    if last_comma >= 0 and last_dot >= 0:
+        if last_comma > last_dot:
             # European: 1.234,56
             cleaned = cleaned.replace('.', '').replace(',', '.')
         else:
             # US: 1,234.56
             cleaned = cleaned.replace(',', '')
-    elif ',' in cleaned:
+    elif last_comma >= 0:
         # Could be European decimal or US thousands
-        parts = cleaned.split(',')
-        if len(parts) == 2 and len(parts[1]) == 2:
+        if comma_count == 1 and len(cleaned) - last_comma == 3:
             # Likely European: 99,99
             cleaned = cleaned.replace(',', '.')
         else:
@@ -81,6 +95,41 @@ class PriceScraper:
         self.timeout_ms = timeout_ms or TIMEOUT_MS
         self.user_agent = USER_AGENT
         self.proxy_url = PROXY_URL
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    def __enter__(self):
+        # Browser startup stays lazy (scrape_product calls _start_browser on
+        # first Playwright-path scrape) so all-static runs never launch one
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start_browser(self):
+        """Launch the browser and context shared by all scrapes."""
+        if self._browser is not None:
+            return
+        # Imported here so browserless paths (static scrapes, --help, tests)
+        # never pay Playwright's import cost
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(**self._get_browser_args())
+        self._context = self._browser.new_context(user_agent=self.user_agent)
+
+    def close(self):
+        """Shut down the shared browser and Playwright driver."""
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
 
     def _get_browser_args(self) -> dict:
         """Get browser launch arguments."""
@@ -97,7 +146,11 @@ class PriceScraper:
 
         return args
 
-    def _setup_page(self, page: Page):
+    # Subresources the scraper never reads; blocking them cuts page weight
+    # and time-to-DOMContentLoaded dramatically on media-heavy sites
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+    def _setup_page(self, page):
         """Configure page for stealth scraping."""
         # Set viewport to common desktop size
         page.set_viewport_size({"width": 1920, "height": 1080})
@@ -109,11 +162,74 @@ class PriceScraper:
             });
         """)
 
+        # Drop requests for resources that can't affect the scraped text
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES
+            else route.continue_()
+        )
+
+    def _scrape_static(self, url: str, selectors: dict, result: dict) -> bool:
+        """
+        Fast path for server-rendered pages: plain HTTP fetch + C HTML parser,
+        no browser. Returns True if a price was extracted, False to fall back
+        to Playwright.
+        """
+        try:
+            import httpx
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            return False
+
+        try:
+            response = httpx.get(
+                url,
+                headers={"User-Agent": self.user_agent},
+                follow_redirects=True,
+                timeout=self.timeout_ms / 1000
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False
+
+        tree = HTMLParser(response.text)
+
+        price_selector = selectors.get("price")
+        price_element = tree.css_first(price_selector) if price_selector else None
+        if price_element is None:
+            return False
+
+        price_text = price_element.text()
+        price = parse_price(price_text)
+        if price is None:
+            return False
+
+        result["price"] = price
+        result["price_raw"] = price_text
+
+        name_selector = selectors.get("name")
+        if name_selector:
+            name_element = tree.css_first(name_selector)
+            if name_element:
+                result["name"] = name_element.text().strip()
+
+        stock_selector = selectors.get("stock")
+        if stock_selector:
+            stock_element = tree.css_first(stock_selector)
+            if stock_element:
+                result["stock_status"] = stock_element.text().strip()
+
+        result["success"] = True
+        return True
+
     def scrape_product(
         self,
         url: str,
         selectors: dict,
-        competitor_name: str = "Unknown"
+        competitor_name: str = "Unknown",
+        context=None,
+        requires_js: bool = True
     ) -> dict:
         """
         Scrape a single product page.
@@ -122,6 +238,9 @@ class PriceScraper:
             url: Full URL to the product page
             selectors: Dict with keys: price, name (optional), stock (optional)
             competitor_name: Name of the competitor for logging
+            context: Optional BrowserContext - or zero-arg callable returning
+                one - to use instead of the shared browser
+            requires_js: If False, try a browserless HTTP fetch first
 
         Returns:
             Dictionary with scraped data
@@ -136,90 +255,192 @@ class PriceScraper:
             "error": None
         }
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(**self._get_browser_args())
-            context = browser.new_context(user_agent=self.user_agent)
-            page = context.new_page()
+        # Static pages don't need Chromium at all
+        if not requires_js and self._scrape_static(url, selectors, result):
+            return result
 
+        from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+        if context is None:
+            # Reuse the shared browser/context; one fresh page per product
+            self._start_browser()
+            context = self._context
+        elif callable(context):
+            # Lazy per-worker provider (see scrape_targets' parallel path)
+            context = context()
+
+        page = None
+        try:
+            page = context.new_page()
             self._setup_page(page)
 
-            try:
-                # Navigate to page
-                page.goto(url, timeout=self.timeout_ms, wait_until="domcontentloaded")
-
-                # Wait for price element
-                price_selector = selectors.get("price")
-                if price_selector:
-                    page.wait_for_selector(price_selector, timeout=self.timeout_ms)
-                    price_element = page.query_selector(price_selector)
-                    if price_element:
-                        price_text = price_element.text_content()
-                        result["price"] = parse_price(price_text)
-                        result["price_raw"] = price_text
-
-                # Get product name (optional)
-                name_selector = selectors.get("name")
-                if name_selector:
-                    name_element = page.query_selector(name_selector)
-                    if name_element:
-                        result["name"] = name_element.text_content().strip()
-
-                # Get stock status (optional)
-                stock_selector = selectors.get("stock")
-                if stock_selector:
-                    stock_element = page.query_selector(stock_selector)
-                    if stock_element:
-                        result["stock_status"] = stock_element.text_content().strip()
-
-                result["success"] = result["price"] is not None
-
-            except PlaywrightTimeout:
-                result["error"] = "Timeout waiting for elements"
-            except Exception as e:
-                result["error"] = str(e)
-            finally:
-                browser.close()
+            # Navigate to page
+            page.goto(url, timeout=self.timeout_ms, wait_until="domcontentloaded")
+
+            # Wait for price element
+            price_selector = selectors.get("price")
+            if price_selector:
+                page.wait_for_selector(price_selector, timeout=self.timeout_ms)
+                price_element = page.query_selector(price_selector)
+                if price_element:
+                    price_text = price_element.text_content()
+                    result["price"] = parse_price(price_text)
+                    result["price_raw"] = price_text
+
+            # Get product name (optional)
+            name_selector = selectors.get("name")
+            if name_selector:
+                name_element = page.query_selector(name_selector)
+                if name_element:
+                    result["name"] = name_element.text_content().strip()
+
+            # Get stock status (optional)
+            stock_selector = selectors.get("stock")
+            if stock_selector:
+                stock_element = page.query_selector(stock_selector)
+                if stock_element:
+                    result["stock_status"] = stock_element.text_content().strip()
+
+            result["success"] = result["price"] is not None
+
+        except PlaywrightTimeout:
+            result["error"] = "Timeout waiting for elements"
+        except Exception as e:
+            result["error"] = str(e)
+        finally:
+            if page is not None:
+                page.close()
 
         return result
 
-    def scrape_competitor(self, competitor_config: dict) -> list[dict]:
+    def scrape_target(self, target: dict, context=None) -> dict:
+        """
+        Scrape one flattened target (see settings.load_product_targets).
+
+        Args:
+            target: Dict with competitor, product_id, url, selectors, requires_js
+            context: Optional BrowserContext (or provider callable) to use
+                instead of the shared one
+
+        Returns:
+            Scrape result dictionary
+        """
+        result = self.scrape_product(
+            url=target["url"],
+            selectors=target["selectors"],
+            competitor_name=target["competitor"],
+            context=context,
+            requires_js=target.get("requires_js", True)
+        )
+        result["product_id"] = target["product_id"]
+
+        if result["success"]:
+            logger.info(f"{target['product_id']}: ${result['price']:.2f}")
+        else:
+            logger.error(f"{target['product_id']}: {result['error']}")
+
+        return result
+
+    def scrape_targets(
+        self,
+        targets: list[dict],
+        workers: int = 1,
+        delay_min: float = 2,
+        delay_max: float = 5
+    ) -> list[dict]:
+        """
+        Scrape a flat list of targets, serially or across worker threads.
+
+        Args:
+            targets: Flattened product records
+            workers: Number of worker threads, each with its own browser
+                (1 = serial, reusing the shared browser)
+            delay_min: Minimum politeness delay between a worker's requests
+            delay_max: Maximum politeness delay between a worker's requests
+
+        Returns:
+            List of scrape results
+        """
+        workers = min(workers, len(targets)) if targets else 1
+
+        if workers <= 1:
+            results = []
+            for target in targets:
+                results.append(self.scrape_target(target))
+                # Random delay between products
+                random_delay(delay_min, delay_max)
+            return results
+
+        # Parallel path. Playwright's sync API is thread-bound: every object
+        # dispatches through a greenlet owned by the thread that called
+        # sync_playwright().start(), so the shared browser must never be
+        # touched from executor workers. Instead each worker thread lazily
+        # starts its own driver + browser - on the first target that needs
+        # one, including a static scrape falling back to Playwright - and
+        # cleans it up on that same thread. Per-host politeness still holds
+        # because each worker delays between its own requests.
+        from playwright.sync_api import sync_playwright
+
+        def scrape_slice(slice_targets: list[dict]) -> list[dict]:
+            playwright = browser = context = None
+
+            def worker_context():
+                nonlocal playwright, browser, context
+                if context is None:
+                    playwright = sync_playwright().start()
+                    browser = playwright.chromium.launch(**self._get_browser_args())
+                    context = browser.new_context(user_agent=self.user_agent)
+                return context
+
+            results = []
+            try:
+                for target in slice_targets:
+                    results.append(self.scrape_target(target, context=worker_context))
+                    random_delay(delay_min, delay_max)
+            finally:
+                if context is not None:
+                    context.close()
+                    browser.close()
+                    playwright.stop()
+            return results
+
+        # Round-robin slicing interleaves competitors across workers
+        slices = [targets[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [
+                result
+                for slice_results in executor.map(scrape_slice, slices)
+                for result in slice_results
+            ]
+
+    def scrape_competitor(self, competitor_config: dict, workers: int = 1) -> list[dict]:
         """
         Scrape all products for a single competitor.
 
         Args:
             competitor_config: Competitor configuration from YAML
+            workers: Number of worker threads (1 = serial)
 
         Returns:
             List of scrape results
         """
-        results = []
         name = competitor_config["name"]
         base_url = competitor_config["base_url"]
-        products = competitor_config.get("products", [])
 
         logger.info(f"Scraping {name}...")
 
-        for product in products:
-            product_url = base_url + product["url"]
-            selectors = product.get("selectors", {})
-
-            result = self.scrape_product(
-                url=product_url,
-                selectors=selectors,
-                competitor_name=name
-            )
-            result["product_id"] = product["id"]
-            results.append(result)
-
-            if result["success"]:
-                logger.info(f"{product['id']}: ${result['price']:.2f}")
-            else:
-                logger.error(f"{product['id']}: {result['error']}")
+        targets = [
+            {
+                "competitor": name,
+                "product_id": product["id"],
+                "url": base_url + product["url"],
+                "selectors": product.get("selectors", {}),
+                "requires_js": product.get("requires_js", True)
+            }
+            for product in competitor_config.get("products", [])
+        ]
 
-            # Random delay between products
-            random_delay()
-
-        return results
+        return self.scrape_targets(targets, workers=workers)
 
     def scrape_all(self) -> list[dict]:
         """
@@ -228,26 +449,18 @@ class PriceScraper:
         Returns:
             List of all scrape results
         """
-        config = load_competitors_config()
-        competitors = config.get("competitors", [])
-        scrape_config = config.get("scraping", {})
-
-        all_results = []
-
-        for competitor in competitors:
-            if not competitor.get("enabled", True):
-                logger.debug(f"Skipping disabled competitor: {competitor['name']}")
-                continue
-
-            results = self.scrape_competitor(competitor)
-            all_results.extend(results)
+        scrape_config = load_competitors_config().get("scraping", {})
 
-            # Delay between competitors
-            delay_min = scrape_config.get("delay_min_seconds", 2)
-            delay_max = scrape_config.get("delay_max_seconds", 5)
-            random_delay(delay_min, delay_max)
+        # Flattened once at config-load time and cached with the YAML
+        targets = load_product_targets()
 
-        return all_results
+        with self:
+            return self.scrape_targets(
+                targets,
+                workers=scrape_config.get("workers", 1),
+                delay_min=scrape_config.get("delay_min_seconds", 2),
+                delay_max=scrape_config.get("delay_max_seconds", 5)
+            )
 
 
 def main():
@@ -268,11 +481,12 @@ def main():
             logger.error("Error: --url required with --test")
             return 1
 
-        result = scraper.scrape_product(
-            url=args.url,
-            selectors={"price": args.selector},
-            competitor_name="Test"
-        )
+        with scraper:
+            result = scraper.scrape_product(
+                url=args.url,
+                selectors={"price": args.selector},
+                competitor_name="Test"
+            )
 
         logger.info(f"Result:")
         logger.info(f"  URL: {result['url']}")
@@ -9,22 +9,35 @@ import argparse
 import sqlite3
 import sys
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from config.settings import DATABASE_PATH
 from execution.logger import get_logger
 
 logger = get_logger()
 
 
+# WAL mode is persistent in the database file, so the pragma (which runs a
+# meta-query) only needs to be issued once per process
+_wal_enabled = False
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get database connection with row factory."""
+    """Get database connection with row factory and tuned pragmas."""
+    global _wal_enabled
+
     conn = sqlite3.connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
+
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+
+    # NORMAL is safe under WAL and avoids an fsync per commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+
     return conn
 
 
@@ -47,10 +60,16 @@ def init_database():
         )
     """)
 
+    # Covers the latest-price lookup (product_id, competitor_name filter +
+    # ORDER BY scraped_at DESC) without a filesort
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_product_id ON prices(product_id)
+        CREATE INDEX IF NOT EXISTS idx_prod_comp_time
+        ON prices(product_id, competitor_name, scraped_at DESC)
     """)
 
+    # Superseded by the composite index above
+    cursor.execute("DROP INDEX IF EXISTS idx_product_id")
+
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_scraped_at ON prices(scraped_at)
     """)
@@ -89,19 +108,58 @@ def save_price(
     return record_id
 
 
-def get_latest_price(product_id: str, competitor_name: str = None) -> Optional[dict]:
+def save_prices_bulk(rows: list[tuple], conn: sqlite3.Connection = None) -> int:
+    """
+    Save many price records in one transaction.
+
+    Args:
+        rows: Tuples of (competitor_name, product_id, product_name, price,
+              currency, stock_status, url)
+        conn: Optional already-open connection to reuse
+
+    Returns:
+        Number of inserted rows.
+    """
+    if not rows:
+        return 0
+
+    close_after = conn is None
+    if conn is None:
+        conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.executemany("""
+        INSERT INTO prices (competitor_name, product_id, product_name, price, currency, stock_status, url)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+
+    conn.commit()
+    if close_after:
+        conn.close()
+
+    return len(rows)
+
+
+def get_latest_price(
+    product_id: str,
+    competitor_name: str = None,
+    cursor: sqlite3.Cursor = None
+) -> Optional[dict]:
     """
     Get the most recent price for a product.
 
     Args:
         product_id: The product identifier
         competitor_name: Optional competitor filter
+        cursor: Optional cursor on an already-open connection to reuse
 
     Returns:
         Dictionary with price data or None if not found.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = None
+    if cursor is None:
+        conn = get_connection()
+        cursor = conn.cursor()
 
     if competitor_name:
         cursor.execute("""
@@ -119,7 +177,8 @@ def get_latest_price(product_id: str, competitor_name: str = None) -> Optional[d
         """, (product_id,))
 
     row = cursor.fetchone()
-    conn.close()
+    if conn is not None:
+        conn.close()
 
     if row:
         return dict(row)
@@ -153,27 +212,67 @@ def get_price_history(product_id: str, limit: int = 100) -> list[dict]:
     return [dict(row) for row in rows]
 
 
-def detect_price_change(
+def get_latest_prices(pairs: list[tuple[str, str]]) -> dict[tuple, float]:
+    """
+    Get the most recent price for many products in a single query.
+
+    Args:
+        pairs: (product_id, competitor_name) tuples to look up
+
+    Returns:
+        Dict mapping (product_id, competitor_name) to the latest price.
+        Pairs with no history are absent.
+    """
+    if not pairs:
+        return {}
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    placeholders = ",".join("(?, ?)" for _ in pairs)
+    params = [value for pair in pairs for value in pair]
+
+    cursor.execute(f"""
+        SELECT product_id, competitor_name, price
+        FROM (
+            SELECT product_id, competitor_name, price,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY product_id, competitor_name
+                       ORDER BY scraped_at DESC
+                   ) AS rn
+            FROM prices
+            WHERE (product_id, competitor_name) IN (VALUES {placeholders})
+        )
+        WHERE rn = 1
+    """, params)
+
+    rows = cursor.fetchall()
+    conn.close()
+
+    return {(row["product_id"], row["competitor_name"]): row["price"] for row in rows}
+
+
+def evaluate_price_change(
     product_id: str,
     competitor_name: str,
+    old_price: Optional[float],
     new_price: float,
     threshold_percent: float = 0
 ) -> Optional[dict]:
     """
-    Check if price has changed from the last recorded value.
+    Compare an already-fetched previous price against a new one.
 
     Args:
         product_id: The product identifier
         competitor_name: The competitor name
+        old_price: Last recorded price, or None for a new product
         new_price: The newly scraped price
         threshold_percent: Minimum % change to trigger (0 = any change)
 
     Returns:
         Dictionary with change details if threshold exceeded, else None.
     """
-    last = get_latest_price(product_id, competitor_name)
-
-    if not last:
+    if old_price is None:
         # New product, no previous price
         return {
             "type": "new_product",
@@ -184,8 +283,6 @@ def detect_price_change(
             "change_percent": None
         }
 
-    old_price = last["price"]
-
     if old_price == new_price:
         return None  # No change
 
@@ -205,6 +302,34 @@ def detect_price_change(
     return None
 
 
+def detect_price_change(
+    product_id: str,
+    competitor_name: str,
+    new_price: float,
+    threshold_percent: float = 0,
+    cursor: sqlite3.Cursor = None
+) -> Optional[dict]:
+    """
+    Check if price has changed from the last recorded value.
+
+    Args:
+        product_id: The product identifier
+        competitor_name: The competitor name
+        new_price: The newly scraped price
+        threshold_percent: Minimum % change to trigger (0 = any change)
+        cursor: Optional cursor on an already-open connection to reuse
+
+    Returns:
+        Dictionary with change details if threshold exceeded, else None.
+    """
+    last = get_latest_price(product_id, competitor_name, cursor=cursor)
+    old_price = last["price"] if last else None
+
+    return evaluate_price_change(
+        product_id, competitor_name, old_price, new_price, threshold_percent
+    )
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(description="Price storage operations")
@@ -6,29 +6,240 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
+import json
+import random
+import re
 import sys
-from pathlib import Path
+import threading
+import time
+from typing import Optional
 
-import httpx
+try:
+    # C serializer: ~5-10x faster than stdlib json and emits UTF-8 bytes
+    import orjson
+except ImportError:
+    orjson = None
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config.settings import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from execution.logger import get_logger
 
 logger = get_logger()
 
+# Direction emoji looked up once per change instead of branching per line
+_EMOJI = {"up": "📈", "down": "📉"}
+
+# Static alert templates compiled once; format_map fills them straight from
+# the change dict without re-parsing the scaffolding per call
+_NEW_PRODUCT_TMPL = (
+    "*New Product Detected*\n\n"
+    "Product: `{product_id}`\n"
+    "Competitor: {competitor}\n"
+    "Price: ${new_price:.2f}"
+)
+
+_PRICE_UP_TMPL = (
+    "📈 *Price Alert*\n\n"
+    "Product: `{product_id}`\n"
+    "Competitor: {competitor}\n\n"
+    "Old price: ${old_price:.2f}\n"
+    "New price: ${new_price:.2f}\n"
+    "Change: {change_percent:+.1f}% (increased)"
+)
+
+# Telegram rejects sendMessage payloads over 4096 chars; leave slack for
+# the header line when packing batch alerts
+MAX_MESSAGE_CHARS = 4096
+_CHUNK_BUDGET = 4000
+
+_PRICE_DOWN_TMPL = (
+    "📉 *Price Alert*\n\n"
+    "Product: `{product_id}`\n"
+    "Competitor: {competitor}\n\n"
+    "Old price: ${old_price:.2f}\n"
+    "New price: ${new_price:.2f}\n"
+    "Change: {change_percent:+.1f}% (decreased)"
+)
+
+
+# Serializing the payload ourselves (instead of post(json=...)) means the
+# bytes are built once and reused verbatim across retry attempts
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_bytes(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Characters Telegram's legacy Markdown parser rejects when they appear
+# unbalanced inside user-supplied fields; an unescaped one turns the whole
+# send into a 400 Bad Request plus a retry round trip
+_MD_SPECIAL = re.compile(r"([_*`\[])")
+
+
+@functools.lru_cache(maxsize=256)
+def _esc(field: str) -> str:
+    """Escape Markdown specials in a config-supplied field (cached, since
+    the same product_ids and competitor names recur every cycle).
+
+    Only for text rendered outside code spans - inside backticks the
+    parser shows backslashes literally; use _esc_code there instead.
+    """
+    return _MD_SPECIAL.sub(r"\\\1", field)
+
+
+@functools.lru_cache(maxsize=256)
+def _esc_code(field: str) -> str:
+    """Sanitize a field rendered inside a backtick code span, where only a
+    backtick can break out (and backslash escapes display literally)."""
+    return field.replace("`", "'")
+
+
+def _format_change_line(change: dict) -> str:
+    """Format one change as a single batch-alert line."""
+    if change["type"] == "new_product":
+        return f"• NEW: `{_esc_code(change['product_id'])}` @ ${change['new_price']:.2f}"
+
+    return (
+        f"{_EMOJI[change['direction']]} `{_esc_code(change['product_id'])}`: "
+        f"${change['old_price']:.2f} → ${change['new_price']:.2f} "
+        f"({change['change_percent']:+.1f}%)"
+    )
+
+
+def _chunk_batch_messages(changes: list[dict]) -> list[str]:
+    """
+    Pack change lines into as few messages as fit under Telegram's
+    4096-char sendMessage limit.
+    """
+    lines = list(map(_format_change_line, changes))
+
+    chunks = []
+    current = []
+    current_len = 0
+    for line in lines:
+        cost = len(line) + 1  # +1 for the joining newline
+        if current and current_len + cost > _CHUNK_BUDGET:
+            chunks.append(current)
+            current = []
+            current_len = 0
+        current.append(line)
+        current_len += cost
+    if current:
+        chunks.append(current)
+
+    total = len(chunks)
+    messages = []
+    for i, chunk in enumerate(chunks, 1):
+        header = (
+            "*Price Monitor Update*" if total == 1
+            else f"*Price Monitor Update ({i}/{total})*"
+        )
+        messages.append(header + "\n\n" + "\n".join(chunk))
+    return messages
+
 
 class TelegramBot:
     """Simple Telegram bot for sending notifications."""
 
     BASE_URL = "https://api.telegram.org/bot{token}"
 
-    def __init__(self, token: str = None, chat_id: str = None):
+    # Telegram's documented limits: ~30 msg/s across chats, ~1 msg/s per chat.
+    # Exceeding them triggers 429s and temporary bans that dwarf any other
+    # latency in this pipeline.
+    GLOBAL_RATE = 30.0
+    PER_CHAT_RATE = 1.0
+
+    # Bounded retries for 429/5xx responses before giving up
+    MAX_SEND_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        token: str = None,
+        chat_id: str = None,
+        pool_size: int = None,
+        pool_timeout: float = None
+    ):
+        # Deferred so importing this module (e.g. for the formatters) doesn't
+        # drag in the httpx stack or run the settings/.env machinery
+        import httpx
+        from config.settings import (
+            TELEGRAM_BOT_TOKEN,
+            TELEGRAM_CHAT_ID,
+            TELEGRAM_POOL_SIZE,
+            TELEGRAM_POOL_TIMEOUT,
+        )
+
         self.token = token or TELEGRAM_BOT_TOKEN
         self.chat_id = chat_id or TELEGRAM_CHAT_ID
         self.api_url = self.BASE_URL.format(token=self.token)
+        pool_size = pool_size or TELEGRAM_POOL_SIZE
+        pool_timeout = pool_timeout or TELEGRAM_POOL_TIMEOUT
+        # One client for the bot's lifetime: keep-alive skips the TCP+TLS
+        # handshake on every send, HTTP/2 compresses the repeated headers.
+        # Pool sizing and the per-phase timeouts are explicit so a stuck
+        # request can't silently exhaust the default pool and turn every
+        # later send into a PoolTimeout.
+        self._client = httpx.Client(
+            base_url=self.api_url,
+            http2=True,
+            timeout=httpx.Timeout(
+                connect=5.0, read=20.0, write=5.0, pool=pool_timeout
+            ),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=max(1, pool_size // 2),
+                keepalive_expiry=60.0
+            )
+        )
+        # Token buckets start full so short bursts go through unthrottled
+        self._global_tokens = self.GLOBAL_RATE
+        self._chat_tokens = self.PER_CHAT_RATE
+        self._bucket_last = time.monotonic()
+
+    def _acquire_send_slot(self):
+        """Block until the rate limits allow another send."""
+        now = time.monotonic()
+        elapsed = now - self._bucket_last
+        self._bucket_last = now
+
+        self._global_tokens = min(
+            self.GLOBAL_RATE, self._global_tokens + elapsed * self.GLOBAL_RATE
+        )
+        self._chat_tokens = min(
+            self.PER_CHAT_RATE, self._chat_tokens + elapsed * self.PER_CHAT_RATE
+        )
+
+        wait = 0.0
+        if self._global_tokens < 1:
+            wait = (1 - self._global_tokens) / self.GLOBAL_RATE
+        if self._chat_tokens < 1:
+            wait = max(wait, (1 - self._chat_tokens) / self.PER_CHAT_RATE)
+
+        if wait > 0:
+            time.sleep(wait)
+            self._global_tokens = min(
+                self.GLOBAL_RATE, self._global_tokens + wait * self.GLOBAL_RATE
+            )
+            self._chat_tokens = min(
+                self.PER_CHAT_RATE, self._chat_tokens + wait * self.PER_CHAT_RATE
+            )
+            self._bucket_last = time.monotonic()
+
+        self._global_tokens -= 1
+        self._chat_tokens -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP client."""
+        self._client.close()
 
     def _validate_config(self):
         """Check if bot is configured."""
@@ -37,31 +248,78 @@ class TelegramBot:
         if not self.chat_id:
             raise ValueError("TELEGRAM_CHAT_ID not configured")
 
-    def send_message(self, text: str, parse_mode: str = "Markdown") -> dict:
+    def send_message(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        return_response: bool = False
+    ) -> Optional[dict]:
         """
         Send a text message to the configured chat.
 
+        Retries 429 responses after the server-suggested retry_after and
+        5xx responses with jittered exponential backoff, up to
+        MAX_SEND_ATTEMPTS total attempts.
+
         Args:
             text: Message text (supports Markdown)
             parse_mode: "Markdown" or "HTML"
+            return_response: Parse and return the Telegram API response;
+                by default the 500+ byte response body is not parsed at all
 
         Returns:
-            Telegram API response
+            Telegram API response dict, or None when return_response is False
         """
+        import httpx
+
         self._validate_config()
 
-        response = httpx.post(
-            f"{self.api_url}/sendMessage",
-            json={
-                "chat_id": self.chat_id,
-                "text": text,
-                "parse_mode": parse_mode
-            },
-            timeout=30
-        )
+        body = _json_bytes({
+            "chat_id": self.chat_id,
+            "text": text,
+            "parse_mode": parse_mode
+        })
+
+        pool_retried = False
+        for attempt in range(self.MAX_SEND_ATTEMPTS):
+            self._acquire_send_slot()
 
-        response.raise_for_status()
-        return response.json()
+            try:
+                response = self._client.post(
+                    "/sendMessage", content=body, headers=_JSON_HEADERS
+                )
+            except httpx.PoolTimeout:
+                # Pool exhausted by in-flight sends; a short pause usually
+                # frees a connection. Retry once, then let it propagate.
+                if pool_retried:
+                    raise
+                pool_retried = True
+                logger.warning("Telegram connection pool exhausted; retrying once")
+                time.sleep(0.5)
+                continue
+
+            if response.status_code == 429:
+                # Honor Telegram's suggested wait; retrying sooner extends the ban
+                try:
+                    wait = response.json().get("parameters", {}).get("retry_after", 2 ** attempt)
+                except ValueError:
+                    wait = 2 ** attempt
+                logger.warning(f"Telegram rate limit hit; retrying in {wait}s")
+                time.sleep(wait + random.uniform(0, 0.5))
+                continue
+
+            if 500 <= response.status_code < 600:
+                wait = min(30, 2 ** attempt)
+                logger.warning(f"Telegram server error {response.status_code}; retrying in {wait}s")
+                time.sleep(wait + random.uniform(0, 1))
+                continue
+
+            response.raise_for_status()
+            return response.json() if return_response else None
+
+        raise RuntimeError(
+            f"sendMessage failed after {self.MAX_SEND_ATTEMPTS} attempts (rate limited or server errors)"
+        )
 
     def format_price_alert(self, change: dict) -> str:
         """
@@ -73,82 +331,285 @@ class TelegramBot:
         Returns:
             Formatted message string
         """
+        fields = {
+            **change,
+            # product_id sits inside backticks in every template; competitor
+            # is plain text, so it gets the full escape
+            "product_id": _esc_code(change["product_id"]),
+            "competitor": _esc(change["competitor"]),
+        }
         if change["type"] == "new_product":
-            return (
-                f"*New Product Detected*\n\n"
-                f"Product: `{change['product_id']}`\n"
-                f"Competitor: {change['competitor']}\n"
-                f"Price: ${change['new_price']:.2f}"
-            )
+            return _NEW_PRODUCT_TMPL.format_map(fields)
 
-        direction = "increased" if change["direction"] == "up" else "decreased"
-        emoji = "📈" if change["direction"] == "up" else "📉"
+        tmpl = _PRICE_UP_TMPL if change["direction"] == "up" else _PRICE_DOWN_TMPL
+        return tmpl.format_map(fields)
 
-        return (
-            f"{emoji} *Price Alert*\n\n"
-            f"Product: `{change['product_id']}`\n"
-            f"Competitor: {change['competitor']}\n\n"
-            f"Old price: ${change['old_price']:.2f}\n"
-            f"New price: ${change['new_price']:.2f}\n"
-            f"Change: {change['change_percent']:+.1f}% ({direction})"
-        )
-
-    def send_price_alert(self, change: dict) -> dict:
+    def send_price_alert(self, change: dict) -> None:
         """
         Send a formatted price alert.
 
+        Identical alerts re-detected within ALERT_DEDUP_TTL_SECONDS are
+        suppressed, skipping the network round trip entirely.
+
         Args:
             change: Dictionary from storage.detect_price_change()
 
         Returns:
-            Telegram API response
+            None; failures surface as exceptions from send_message
         """
+        from config.settings import ALERT_DEDUP_TTL_SECONDS
+        from execution.utils import cached_send
+
         message = self.format_price_alert(change)
-        return self.send_message(message)
+        cached_send(
+            f"{self.chat_id}\x00{message}".encode(),
+            lambda: self.send_message(message),
+            ttl=ALERT_DEDUP_TTL_SECONDS
+        )
 
-    def send_batch_alerts(self, changes: list[dict]) -> dict:
+    def send_batch_alerts(self, changes: list[dict]) -> None:
         """
-        Send multiple price changes in a single message.
+        Send multiple price changes coalesced into as few messages as
+        possible (chunked to respect Telegram's 4096-char limit).
 
         Args:
             changes: List of change dictionaries
 
         Returns:
-            Telegram API response
+            None; failures surface as exceptions from send_message
         """
         if not changes:
-            return {"ok": True, "result": "No changes to report"}
+            return
 
-        lines = ["*Price Monitor Update*\n"]
+        for message in _chunk_batch_messages(changes):
+            self.send_message(message)
 
-        for change in changes:
-            if change["type"] == "new_product":
-                lines.append(
-                    f"• NEW: `{change['product_id']}` @ ${change['new_price']:.2f}"
-                )
-            else:
-                emoji = "📈" if change["direction"] == "up" else "📉"
-                lines.append(
-                    f"{emoji} `{change['product_id']}`: "
-                    f"${change['old_price']:.2f} → ${change['new_price']:.2f} "
-                    f"({change['change_percent']:+.1f}%)"
+
+class BatchingTelegramBot(TelegramBot):
+    """
+    TelegramBot that coalesces alerts over a short window (Nagle-style).
+
+    send_price_alert calls arriving within FLUSH_INTERVAL of each other are
+    accumulated and flushed as one send_batch_alerts call, trading up to
+    ~200ms of latency for far fewer API round trips when many changes land
+    in a single poll.
+    """
+
+    # How long to wait for more alerts before flushing
+    FLUSH_INTERVAL = 0.2
+
+    # Flush immediately at this many pending alerts to bound tail latency
+    MAX_PENDING = 20
+
+    def __init__(self, token: str = None, chat_id: str = None):
+        super().__init__(token=token, chat_id=chat_id)
+        self._pending: list[dict] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def send_price_alert(self, change: dict) -> None:
+        """
+        Queue a price alert for the next batch flush.
+
+        Unlike TelegramBot.send_price_alert this returns before the alert
+        is on the wire; the flush happens after FLUSH_INTERVAL, when
+        MAX_PENDING alerts have accumulated, or on close().
+        """
+        with self._lock:
+            self._pending.append(change)
+            if len(self._pending) >= self.MAX_PENDING:
+                self._flush_locked()
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_locked(self):
+        """Send and clear pending alerts; caller must hold self._lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        changes = self._pending
+        self._pending = []
+        self.send_batch_alerts(changes)
+
+    def flush(self):
+        """Send any pending alerts immediately."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush pending alerts, then close the underlying HTTP client."""
+        self.flush()
+        super().close()
+
+
+class AsyncTelegramBot:
+    """
+    Async Telegram sender for concurrent fan-out.
+
+    Where TelegramBot sends one message per round trip, this multiplexes
+    many sendMessage calls over a single HTTP/2 connection, so K alerts
+    (or one alert to K chats) complete in roughly one round trip.
+    """
+
+    # Bound on concurrent in-flight sends; stays under Telegram's ~30 msg/s
+    # global limit while still multiplexing over one connection
+    MAX_CONCURRENT_SENDS = 20
+
+    def __init__(self, token: str = None, chat_id: str = None):
+        import httpx
+        from config.settings import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+
+        self.token = token or TELEGRAM_BOT_TOKEN
+        self.chat_id = chat_id or TELEGRAM_CHAT_ID
+        self.api_url = TelegramBot.BASE_URL.format(token=self.token)
+        self._aclient = httpx.AsyncClient(
+            base_url=self.api_url,
+            http2=True,
+            timeout=httpx.Timeout(connect=5.0, read=20.0, write=5.0, pool=3.0),
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONCURRENT_SENDS,
+                max_keepalive_connections=4,
+                keepalive_expiry=60.0
+            )
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self._aclient.aclose()
+
+    async def _send_one(self, payload: dict, semaphore: asyncio.Semaphore):
+        """
+        Post one sendMessage payload under the concurrency bound.
+
+        Mirrors the sync retry policy: 429s wait out the server-suggested
+        retry_after and 5xx responses back off exponentially with jitter
+        (holding the semaphore slot, which throttles the whole batch), up
+        to MAX_SEND_ATTEMPTS total attempts.
+        """
+        body = _json_bytes(payload)
+        async with semaphore:
+            for attempt in range(TelegramBot.MAX_SEND_ATTEMPTS):
+                response = await self._aclient.post(
+                    "/sendMessage", content=body, headers=_JSON_HEADERS
                 )
 
-        message = "\n".join(lines)
-        return self.send_message(message)
+                if response.status_code == 429:
+                    try:
+                        wait = response.json().get("parameters", {}).get("retry_after", 2 ** attempt)
+                    except ValueError:
+                        wait = 2 ** attempt
+                    logger.warning(f"Telegram rate limit hit; retrying in {wait}s")
+                    await asyncio.sleep(wait + random.uniform(0, 0.5))
+                    continue
+
+                if 500 <= response.status_code < 600:
+                    wait = min(30, 2 ** attempt)
+                    logger.warning(f"Telegram server error {response.status_code}; retrying in {wait}s")
+                    await asyncio.sleep(wait + random.uniform(0, 1))
+                    continue
+
+                response.raise_for_status()
+                return response
+
+        raise RuntimeError(
+            f"sendMessage failed after {TelegramBot.MAX_SEND_ATTEMPTS} attempts (rate limited or server errors)"
+        )
+
+    async def send_many(
+        self,
+        messages: list[str],
+        chat_ids: list[str] = None,
+        parse_mode: str = "Markdown"
+    ) -> list[dict]:
+        """
+        Send several messages concurrently.
+
+        In-flight sends are capped at MAX_CONCURRENT_SENDS and 429s are
+        retried per the server's retry_after, so large fan-outs don't
+        burst past Telegram's global rate limit.
+
+        Args:
+            messages: Message texts to send
+            chat_ids: Target chats (defaults to the configured chat)
+            parse_mode: "Markdown" or "HTML"
+
+        Returns:
+            List of Telegram API responses, one per (chat, message) pair
+        """
+        if not self.token:
+            raise ValueError("TELEGRAM_BOT_TOKEN not configured")
+        chat_ids = chat_ids or [self.chat_id]
+        if not all(chat_ids):
+            raise ValueError("TELEGRAM_CHAT_ID not configured")
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        responses = await asyncio.gather(*(
+            self._send_one(
+                {"chat_id": chat_id, "text": text, "parse_mode": parse_mode},
+                semaphore
+            )
+            for chat_id in chat_ids
+            for text in messages
+        ))
+        return [response.json() for response in responses]
+
+    async def send_batch_alerts_async(self, changes: list[dict]) -> None:
+        """
+        Send coalesced batch-alert chunks concurrently.
+
+        The chunks from _chunk_batch_messages are posted in parallel over
+        the shared HTTP/2 connection, so N chunks complete in roughly one
+        round trip instead of N.
+
+        Args:
+            changes: List of change dictionaries
+        """
+        if not changes:
+            return
+        if not self.token:
+            raise ValueError("TELEGRAM_BOT_TOKEN not configured")
+        if not self.chat_id:
+            raise ValueError("TELEGRAM_CHAT_ID not configured")
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        await asyncio.gather(*(
+            self._send_one(
+                {"chat_id": self.chat_id, "text": text, "parse_mode": "Markdown"},
+                semaphore
+            )
+            for text in _chunk_batch_messages(changes)
+        ))
 
 
 def main():
     """CLI entry point."""
+    import httpx
+
     parser = argparse.ArgumentParser(description="Telegram notification sender")
     parser.add_argument("--test", metavar="MESSAGE", help="Send a test message")
 
     args = parser.parse_args()
 
     if args.test:
+        from execution.utils import require_env
+
         try:
-            bot = TelegramBot()
-            result = bot.send_message(args.test)
+            # Fail fast on missing configuration before opening any client
+            require_env("TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID")
+            with TelegramBot() as bot:
+                result = bot.send_message(args.test, return_response=True)
             if result.get("ok"):
                 logger.info("Message sent successfully!")
             else:
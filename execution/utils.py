@@ -2,11 +2,20 @@
 Shared utilities for execution scripts.
 """
 
+import functools
+import hashlib
 import json
 import os
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    # C serializer: ~5-10x faster than stdlib json and emits UTF-8 bytes
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -16,31 +25,113 @@ TMP_DIR = PROJECT_ROOT / ".tmp"
 DIRECTIVES_DIR = PROJECT_ROOT / "directives"
 EXECUTION_DIR = PROJECT_ROOT / "execution"
 
+# str forms cached once; open()/os.path.join on str skips the per-call
+# Path allocation and os.fspath conversion in tight checkpoint loops
+TMP_DIR_STR = str(TMP_DIR)
+
 
 def ensure_tmp_dir():
     """Ensure .tmp directory exists."""
-    TMP_DIR.mkdir(exist_ok=True)
+    os.makedirs(TMP_DIR_STR, exist_ok=True)
+
+
+def _write_atomic(filepath: str, buf: bytes):
+    """Write buf to filepath via a same-directory sidecar + os.replace."""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+    os.replace(tmp_path, filepath)
 
 
 def save_json(data: dict, filename: str) -> Path:
-    """Save data to .tmp as JSON."""
+    """
+    Save data to .tmp as JSON.
+
+    The document is serialized to one bytes buffer, written to a sidecar
+    file, and moved into place with os.replace, so concurrent readers see
+    either the old or the new file - never a truncated one - and the data
+    lands in a single write call.
+    """
     ensure_tmp_dir()
-    filepath = TMP_DIR / filename
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    return filepath
+    filepath = os.path.join(TMP_DIR_STR, filename)
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _write_atomic(filepath, buf)
+    return Path(filepath)
 
 
 def load_json(filename: str) -> dict:
     """Load JSON from .tmp directory."""
-    filepath = TMP_DIR / filename
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    filepath = os.path.join(TMP_DIR_STR, filename)
+    with open(filepath, "rb") as f:
+        buf = f.read()
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+# Last-send timestamps keyed by SHA256 of the payload; bounded so a
+# long-running daemon can't grow it without limit
+_send_cache = {}
+_SEND_CACHE_MAX = 1024
+
+
+def cached_send(key_material: bytes, send_fn, ttl: float = 300):
+    """
+    Run send_fn at most once per ttl seconds for identical key_material.
+
+    Args:
+        key_material: Bytes identifying the send (e.g. chat_id + message)
+        send_fn: Zero-argument callable performing the actual send
+        ttl: Seconds to suppress duplicates (<= 0 disables caching)
 
+    Returns:
+        send_fn's result, or None when the send was suppressed.
+    """
+    if ttl <= 0:
+        return send_fn()
 
+    key = hashlib.sha256(key_material).digest()
+    now = time.monotonic()
+
+    last = _send_cache.get(key)
+    if last is not None and now - last < ttl:
+        return None
+
+    result = send_fn()
+
+    if len(_send_cache) >= _SEND_CACHE_MAX:
+        # Evict the stalest entry
+        del _send_cache[min(_send_cache, key=_send_cache.get)]
+    _send_cache[key] = now
+
+    return result
+
+
+@functools.lru_cache(maxsize=None)
 def get_env(key: str, required: bool = True) -> str:
-    """Get environment variable with optional requirement check."""
+    """
+    Get environment variable with optional requirement check.
+
+    Cached: the environment is loaded once at startup via load_dotenv and
+    treated as immutable afterwards.
+    """
     value = os.getenv(key)
     if required and not value:
         raise ValueError(f"Missing required environment variable: {key}")
     return value or ""
+
+
+def require_env(*keys: str):
+    """
+    Validate a set of required environment variables in one pass.
+
+    Call once at process start so misconfiguration fails fast instead of
+    surfacing mid-run from some per-call lookup.
+    """
+    missing = [key for key in keys if not os.getenv(key)]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
@@ -4,16 +4,61 @@ Tests for the scraper module.
 
 import pytest
 
+from execution.scraper import parse_price
+from execution.telegram import MAX_MESSAGE_CHARS, _chunk_batch_messages
 
-class TestScraper:
-    """Test scraper functionality."""
 
-    def test_placeholder(self):
-        """Placeholder test - replace with real tests."""
-        assert True
+class TestParsePrice:
+    """parse_price normalizes US and European formats to a float."""
 
-    # TODO: Add tests for:
+    @pytest.mark.parametrize("text,expected", [
+        ("$99.99", 99.99),
+        ("€89,99", 89.99),
+        ("99.99 USD", 99.99),
+        ("1,234.56", 1234.56),
+        ("1.234,56", 1234.56),
+        ("1,234", 1234.0),
+        ("$1.234.567,89", 1234567.89),
+        ("Price: 100", 100.0),
+    ])
+    def test_known_formats(self, text, expected):
+        assert parse_price(text) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("text", ["", None, "no price here", "$", "..,,"])
+    def test_garbage_returns_none(self, text):
+        assert parse_price(text) is None
+
+
+class TestChunkBatchMessages:
+    """Batch packing must respect Telegram's hard 4096-char limit."""
+
+    @staticmethod
+    def _change(i: int) -> dict:
+        return {
+            "type": "price_change",
+            "direction": "up",
+            "product_id": f"product-{i:04d}",
+            "old_price": 100.0 + i,
+            "new_price": 110.0 + i,
+            "change_percent": 10.0,
+        }
+
+    def test_few_changes_fit_one_message(self):
+        messages = _chunk_batch_messages([self._change(i) for i in range(3)])
+        assert len(messages) == 1
+        assert messages[0].startswith("*Price Monitor Update*")
+
+    def test_every_message_under_telegram_limit(self):
+        messages = _chunk_batch_messages([self._change(i) for i in range(500)])
+        assert len(messages) > 1
+        assert all(len(message) <= MAX_MESSAGE_CHARS for message in messages)
+
+    def test_no_change_dropped_by_chunking(self):
+        changes = [self._change(i) for i in range(500)]
+        combined = "\n".join(_chunk_batch_messages(changes))
+        assert all(change["product_id"] in combined for change in changes)
+
+    # TODO: Add browser-dependent tests for:
     # - test_scrape_single_url
-    # - test_extract_price
     # - test_handle_timeout
     # - test_stealth_headers